@@ -5,30 +5,514 @@ Addresses bypass techniques with advanced pattern detection and semantic analysi
 """
 
 import argparse
+import bisect
 import json
+import mmap
 import os
 import re
 import sys
+import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime
 import yaml
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Severity levels
+CRITICAL = "CRITICAL"
+HIGH = "HIGH"
+MEDIUM = "MEDIUM"
+LOW = "LOW"
+
+# Below this many scripts, process start-up costs more than it saves
+_MIN_PARALLEL_SCRIPTS = 8
+
+# Files read in full (scripts, references, Python sources) larger than this
+# are reported rather than scanned, bounding the work any one file can cause
+_MAX_SCAN_BYTES = 8 * 1024 * 1024
+
+# Threads reading asset headers; the work is I/O-bound, so this overlaps
+# disk or network filesystem latency rather than using more CPU
+_ASSET_READERS = 8
+
+
+def _compile(pattern, flags=0):
+    """Compile with RE2 when it is installed, otherwise with re
+
+    RE2 matches in time linear in the input, so a hostile file cannot make
+    the scanner backtrack. Patterns RE2 rejects (lookaround, backreferences)
+    or flags it cannot express fall back to re.
+    """
+    if re2 is not None and not flags & ~(re.IGNORECASE | re.DOTALL):
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        options.dot_nl = bool(flags & re.DOTALL)
+        options.log_errors = False
+        if isinstance(pattern, bytes):
+            # One character per byte, as re does for bytes patterns
+            options.encoding = re2.Options.Encoding.LATIN1
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+
+# Patterns are compiled once at import time; the checkers below run them
+# against every scanned file. Patterns applied to file contents are bytes
+# patterns so files can be scanned straight from an mmap without decoding.
+# In bytes patterns \w is ASCII-only; identifiers use [\w\x80-\xff] so
+# names with non-ASCII letters (UTF-8 encoded) still match.
+
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+# Frontmatter block including its closing line, skipped by the markdown scan
+_FRONTMATTER_BLOCK_RE = re.compile(r'---\n.*?\n---\n', re.DOTALL)
+_MD_CODE_BLOCK_RE = re.compile(r'```.*?\n(.*?)```', re.DOTALL)
+_MD_DANGEROUS_CODE_RE = re.compile(r'exec\(|eval\(|__import__|getattr.*system')
+
+_YAML_DANGEROUS = [
+    (re.compile(r'!\s*<', re.IGNORECASE), "YAML tag directive (potential code execution)"),
+    (re.compile(r'__proto__', re.IGNORECASE), "Prototype pollution attempt"),
+    (re.compile(r'!!python', re.IGNORECASE), "Python object deserialization"),
+    (re.compile(r'eval\(', re.IGNORECASE), "Eval function call in YAML"),
+    (re.compile(r'exec\(', re.IGNORECASE), "Exec function call in YAML"),
+]
+
+_INDIRECT_EXECUTION = [
+    # getattr patterns
+    (_compile(rb'getattr\s*\([^,]+,\s*[\'"][^\'"]*(?:system|exec|eval|compile|open)[^\'"]*[\'"]', re.IGNORECASE),
+     CRITICAL, "getattr accessing dangerous function names"),
+
+    # String concatenation to build function names
+    (_compile(rb'getattr\s*\([^,]+,\s*[^)]*\+[^)]*\)', re.IGNORECASE),
+     CRITICAL, "Dynamic function name via string concatenation"),
+
+    # __builtins__ manipulation
+    (_compile(rb'__builtins__\s*\[|getattr\s*\(__builtins__', re.IGNORECASE),
+     CRITICAL, "__builtins__ manipulation"),
+
+    # Class traversal (sandbox escape)
+    (_compile(rb'__class__\.__base__\.__subclasses__', re.IGNORECASE),
+     CRITICAL, "Class hierarchy traversal (sandbox escape pattern)"),
+
+    # Dictionary-based execution
+    (_compile(rb'\{[^}]*[\'"](?:exec|eval|system)[\'"][^}]*\}\[', re.IGNORECASE),
+     CRITICAL, "Dictionary-based function call obfuscation"),
+
+    # Lambda with dangerous functions
+    (_compile(rb'lambda[^:]*:\s*(?:exec|eval|__import__|getattr)', re.IGNORECASE),
+     HIGH, "Lambda wrapping dangerous operations"),
+
+    # importlib with concatenation
+    (_compile(rb'importlib\.import_module\s*\([^)]*\+[^)]*\)', re.IGNORECASE),
+     CRITICAL, "Dynamic module import with string manipulation"),
+]
+
+_ADVANCED_OBFUSCATION = [
+    # Compression
+    (_compile(rb'zlib\.decompress|gzip\.decompress|bz2\.decompress', re.IGNORECASE),
+     HIGH, "Compressed payload detected"),
+
+    # URL encoding
+    (_compile(rb'urllib\.parse\.unquote|quote_plus\(', re.IGNORECASE),
+     MEDIUM, "URL-encoded content"),
+
+    # ROT13/Caesar cipher
+    (_compile(rb'codecs\.decode\([^,]+,\s*[\'"]rot', re.IGNORECASE),
+     HIGH, "ROT cipher encoding"),
+
+    # XOR encoding
+    (_compile(rb'chr\s*\(\s*ord\([^)]+\)\s*\^', re.IGNORECASE),
+     HIGH, "XOR encoding pattern"),
+
+    # Hex to bytes
+    (_compile(rb'bytes\.fromhex\(|bytearray\.fromhex\(', re.IGNORECASE),
+     MEDIUM, "Hex-to-bytes conversion"),
+
+    # AST manipulation
+    (_compile(rb'ast\.parse\([^)]+\).*?ast\.[\w\x80-\xff]+\s*=', re.IGNORECASE),
+     HIGH, "AST manipulation (code rewriting)"),
+
+    # Deserialization
+    (_compile(rb'marshal\.loads|pickle\.loads|yaml\.(?:load|unsafe_load)\(', re.IGNORECASE),
+     CRITICAL, "Unsafe deserialization"),
+]
+
+# exec/eval near a decoded payload escalates the finding to CRITICAL
+_EXEC_EVAL_RE = re.compile(r'exec|eval')
+
+_SHELL_INJECTION = [
+    _compile(rb'subprocess\.[\w\x80-\xff]+\s*\(\s*\[\s*[\'"](?:/bin/)?(?:bash|sh|zsh|ksh)[\'"]', re.IGNORECASE),
+    _compile(rb'subprocess\.[\w\x80-\xff]+\s*\(\s*\[\s*[\'"](?:python|python3)[\'"],\s*[\'"]-c[\'"]', re.IGNORECASE),
+    _compile(rb'subprocess\.[\w\x80-\xff]+\s*\(\s*\[\s*[\'"]perl[\'"],\s*[\'"]-e[\'"]', re.IGNORECASE),
+    _compile(rb'subprocess\.[\w\x80-\xff]+\s*\(\s*\[\s*[\'"]ruby[\'"],\s*[\'"]-e[\'"]', re.IGNORECASE),
+    _compile(rb'subprocess\.[\w\x80-\xff]+\s*\(\s*\[\s*[\'"]awk[\'"].*system', re.IGNORECASE),
+    _compile(rb'subprocess\.[\w\x80-\xff]+\s*\(\s*\[\s*[\'"]jq[\'"].*@sh', re.IGNORECASE),
+    _compile(rb'subprocess\.[\w\x80-\xff]+\s*\(\s*\[\s*[\'"]sed[\'"].*e[\'"]', re.IGNORECASE),
+]
+
+_TIME_BOMBS = [
+    _compile(rb'datetime\..*\.(?:day|month|year|hour|minute)'),
+    _compile(rb'time\.time\(\)\s*[><=]'),
+    _compile(rb'if\s+.*datetime\.'),
+    _compile(rb'time\.sleep\([^)]*\).*(?:os\.system|subprocess|exec|eval)'),
+]
+
+# Dangerous operations that make a nearby time check suspicious
+_TIME_BOMB_SINK_RE = re.compile(
+    r'os\.system|subprocess|exec|eval|requests\.(post|get)|urllib|socket', re.IGNORECASE
+)
+
+_ENV_MANIPULATION = [
+    (_compile(rb'os\.environ\[[\'"](?:LD_PRELOAD|LD_LIBRARY_PATH)[\'"]', re.IGNORECASE),
+     "LD_PRELOAD/LD_LIBRARY_PATH manipulation (library hijacking)"),
+    (_compile(rb'os\.environ\[[\'"]PATH[\'"]', re.IGNORECASE),
+     "PATH manipulation (command hijacking)"),
+    (_compile(rb'os\.environ\[[\'"]PYTHONPATH[\'"]', re.IGNORECASE),
+     "PYTHONPATH manipulation (module hijacking)"),
+    (_compile(rb'os\.putenv\(', re.IGNORECASE),
+     "Direct environment modification via putenv"),
+]
+
+# Documentation checks: code hidden in HTML comments, and dangerous calls
+# inside fenced python/bash/sh examples
+_COMMENT_CODE_RE = re.compile(rb'exec|eval|os\.system|import os', re.IGNORECASE)
+_REF_CODE_BLOCK_RE = re.compile(rb'```(?:python|bash|sh)\n(.*?)```', re.DOTALL)
+_REF_DANGEROUS_CODE_RE = re.compile(rb'exec\(|eval\(|os\.system\(|subprocess\..*shell\s*=\s*True')
+
+# Cross-file data flow: user input read in one file, dangerous sink in another
+_FLOW_INPUT_RE = re.compile(rb'input\(|sys\.argv|os\.environ|request\.(args|form|json)')
+_FLOW_SINK_RE = re.compile(rb'os\.system|subprocess\.|exec\(|eval\(')
+
+# Checks that report every match: (category, impact, escalate on nearby
+# exec/eval, [(pattern, severity, title), ...])
+_SCRIPT_CHECKS = [
+    ("Obfuscated Execution", "Code execution via obfuscation/indirection", False,
+     _INDIRECT_EXECUTION),
+    ("Code Obfuscation", "Obfuscated code hiding potential payload", True,
+     _ADVANCED_OBFUSCATION),
+    ("Shell Injection", "Shell spawned; command injection if user input reaches arguments", False,
+     [(pattern, CRITICAL, "Shell/interpreter invocation with injection risk")
+      for pattern in _SHELL_INJECTION]),
+    ("Environment Manipulation", "Can hijack library/command loading mechanisms", False,
+     [(pattern, HIGH, desc) for pattern, desc in _ENV_MANIPULATION]),
+]
+
+_SCRIPT_PATTERNS = [
+    (pattern, severity, category, title, impact, escalate)
+    for category, impact, escalate, patterns in _SCRIPT_CHECKS
+    for pattern, severity, title in patterns
+]
+
+# Environment checks come last in _SCRIPT_PATTERNS; they are run after the
+# time-bomb check, as the original scanner reported them
+_ENV_PATTERNS_START = len(_SCRIPT_PATTERNS) - len(_ENV_MANIPULATION)
+
+
+def _leading_literals(pattern: str) -> List[str]:
+    """Literal prefix every match of each top-level alternative starts with ('' if none)"""
+    literals = []
+    prefix = ''
+    collecting = True
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            literal = None if pattern[i + 1].isalnum() else pattern[i + 1]
+            i += 2
+        elif c == '[':
+            # Skip the character class; a leading ']' (after an optional '^') is literal
+            i += 2 if pattern[i + 1] == '^' else 1
+            i += 1 if pattern[i] == ']' else 0
+            while pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            literal = None
+            i += 1
+        else:
+            i += 1
+            if c == '(':
+                depth += 1
+            elif c == ')':
+                depth -= 1
+            elif c == '|' and depth == 0:
+                literals.append(prefix)
+                prefix = ''
+                collecting = True
+                continue
+            literal = None if c in '().^$*+?{}|' else c
+
+        if collecting:
+            # A character followed by ?, * or {m,n} may be absent from the match
+            if literal is None or pattern[i:i + 1] in ('?', '*', '{'):
+                collecting = False
+            else:
+                prefix += literal
+    literals.append(prefix)
+    return literals
+
+
+def _fuse(patterns: List[bytes]) -> bytes:
+    """Join bytes patterns into one alternation"""
+    return b'|'.join(b'(?:%s)' % pattern for pattern in patterns)
+
+
+def _guard_first_chars(fused: bytes, patterns: List[bytes]) -> bytes:
+    """Prefix a fused alternation with a lookahead on its possible first characters
+
+    sre tries every branch at every offset; the lookahead lets it skip most
+    offsets without entering the alternation. RE2 needs no such help (and
+    does not support lookahead).
+    """
+    literals = [literal for pattern in patterns for literal in _leading_literals(pattern.decode('ascii'))]
+    if not all(literals):
+        return fused
+    leading = ''.join(sorted({literal[0] for literal in literals}))
+    return b'(?=[%s])(?:%s)' % (re.escape(leading).encode('ascii'), fused)
+
+
+def _build_automaton(patterns: List[bytes]):
+    """Aho-Corasick automaton over the lower-cased literal prefixes of patterns
+
+    Each key maps to the indexes of the patterns it starts. Returns None when
+    pyahocorasick is unavailable or some pattern has no literal prefix.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for index, pattern in enumerate(patterns):
+        literals = _leading_literals(pattern.decode('ascii'))
+        if not all(literals):
+            return None
+        for literal in literals:
+            key = literal.lower()
+            automaton.add_word(key, automaton.get(key, ()) + (index,))
+    automaton.make_automaton()
+    return automaton
+
+
+def _compile_fused(patterns: List[bytes]):
+    """Compile the fused alternation with RE2 when it is installed, otherwise with re"""
+    fused = _fuse(patterns)
+    if re2 is not None:
+        return _compile(fused, re.IGNORECASE)
+    return re.compile(_guard_first_chars(fused, patterns), re.IGNORECASE)
+
+
+# All script patterns fused into one alternation, so a file none of them
+# matches is dismissed in a single pass
+_SCRIPT_SOURCES = [entry[0].pattern for entry in _SCRIPT_PATTERNS]
+_SCRIPT_RE = _compile_fused(_SCRIPT_SOURCES)
+
+# Lower-cased literal prefixes of each script pattern; a pattern whose
+# prefixes are all absent from a file cannot match it
+_SCRIPT_LITERALS = [
+    tuple(literal.lower().encode('ascii') for literal in _leading_literals(source.decode('ascii')))
+    for source in _SCRIPT_SOURCES
+]
+
+# With pyahocorasick installed, one automaton pass over the file finds every
+# script pattern whose literal prefix occurs in it
+_SCRIPT_AUTOMATON = _build_automaton(_SCRIPT_SOURCES)
+
+_NEWLINE_RE = re.compile(b'\n')
+
+# Any byte outside ASCII: such scripts are NFKC-normalized before scanning
+_NON_ASCII_RE = re.compile(rb'[\x80-\xff]')
+
+# YAML keys associated with prototype pollution or code execution; checked
+# once per key of every mapping in the frontmatter
+_SUSPICIOUS_YAML_KEYS = frozenset({
+    '__proto__', 'constructor', 'prototype',
+    'exec', 'eval', 'system', '__class__', '__init__',
+})
+
+# Known typosquats -> the package they impersonate
+_TYPOSQUATS = {
+    'request': 'requests',
+    'urlib': 'urllib',
+    'numppy': 'numpy',
+    'beatifulsoup': 'beautifulsoup4',
+    'scikit-learn': 'sklearn',
+}
+
+# Extensions of obvious binaries, never scanned as text
+_BINARY_SUFFIXES = frozenset({
+    '.pyc', '.so', '.dll', '.exe', '.bin', '.dat',
+    '.png', '.jpg', '.jpeg', '.gif', '.ico', '.zip', '.tar', '.gz',
+})
+
+# Executable signatures found in the first four bytes of a file
+_EXECUTABLE_MAGIC = {
+    b'\x7fELF': "ELF",
+    b'MZ\x90\x00': "PE",
+    b'\xca\xfe\xba\xbe': "Mach-O",
+}
+
+
+def _read_mapped(path: Path):
+    """Map a file read-only; empty files (which cannot be mapped) yield b''"""
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b''
+
+
+def _read_head(path: Path, size: int) -> bytes:
+    """Read the first size bytes of a file with raw os-level I/O (no buffered reader)"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _executable_format(path: Path) -> Optional[str]:
+    """Executable format named by a file's header, or None (also if it cannot be read)"""
+    try:
+        return _EXECUTABLE_MAGIC.get(_read_head(path, 4))
+    except OSError:
+        return None
+
+
+def _html_comment_with_code(content: bytes) -> Optional[bytes]:
+    """First HTML comment containing code, or None
+
+    Each comment is searched on its own, between its delimiters, so many
+    unterminated comments cannot make the scan quadratic.
+    """
+    start = content.find(b'<!--')
+    while start != -1:
+        end = content.find(b'-->', start + 4)
+        if end == -1:
+            return None
+        if _COMMENT_CODE_RE.search(content, start + 4, end):
+            return content[start:end + 3]
+        start = content.find(b'<!--', end + 3)
+    return None
+
+
+def _script_candidates(content: bytes) -> List[int]:
+    """Indexes of the script patterns that may match content, in check order"""
+    # Patterns are case-insensitive and ASCII, so the literal prefixes are
+    # looked up in a lower-cased copy, made only once a search needs it
+    if _SCRIPT_AUTOMATON is not None:
+        # latin-1 maps bytes 1:1 onto the str the automaton searches
+        found = set()
+        for _, indexes in _SCRIPT_AUTOMATON.iter(content[:].lower().decode('latin-1')):
+            found.update(indexes)
+        return sorted(found)
+
+    # Most files match no pattern and are dismissed without a copy
+    if not _SCRIPT_RE.search(content):
+        return []
+    haystack = content[:].lower()
+    return [
+        index for index, literals in enumerate(_SCRIPT_LITERALS)
+        if any(literal in haystack for literal in literals)
+    ]
+
+
+def _nfkc_normalized(content: bytes) -> bytes:
+    """Content NFKC-normalized, as Python normalizes identifiers, re-encoded as UTF-8
+
+    The script patterns are ASCII byte patterns, so without this
+    subprocess.\uff52un (fullwidth r) or \u017fubprocess.run (long s), which
+    Python runs as subprocess.run, would match none of them.
+    """
+    return unicodedata.normalize('NFKC', content[:].decode('utf-8', 'replace')).encode('utf-8')
+
+
+def _line_starts(content: bytes) -> List[int]:
+    """Offsets at which each line of content begins, for bisect-based line lookup"""
+    return [0] + [match.end() for match in _NEWLINE_RE.finditer(content)]
+
+
+def _data_flow_flags(content: bytes) -> Tuple[bool, bool]:
+    """Whether content reads user input, and whether it reaches a dangerous sink"""
+    return bool(_FLOW_INPUT_RE.search(content)), bool(_FLOW_SINK_RE.search(content))
+
+
+def _dumps(data) -> bytes:
+    """Serialize a report as indented JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+class _CriticalHit(Exception):
+    """Raised under --fail-fast to abandon a scan at its first CRITICAL finding"""
+
+
+@dataclass(slots=True)
+class Finding:
+    """A single security finding"""
+    severity: str
+    category: str
+    title: str
+    location: str
+    impact: str
+    description: Optional[str] = None
+    evidence: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """Report form: fields in report order, unset optional fields omitted"""
+        data = asdict(self)
+        return {
+            key: data[key]
+            for key in ("severity", "category", "title", "description", "location", "evidence", "impact")
+            if data[key] is not None
+        }
+
+
 class EnhancedSecurityScanner:
     """Enhanced security scanner with advanced detection capabilities"""
 
     # Severity levels
-    CRITICAL = "CRITICAL"
-    HIGH = "HIGH"
-    MEDIUM = "MEDIUM"
-    LOW = "LOW"
+    CRITICAL = CRITICAL
+    HIGH = HIGH
+    MEDIUM = MEDIUM
+    LOW = LOW
 
-    def __init__(self, skill_path: str, verbose: bool = False):
+    def __init__(self, skill_path: str, verbose: bool = False, jobs: int = 1, fail_fast: bool = False):
         self.skill_path = Path(skill_path)
         self.verbose = verbose
-        self.findings = []
+        self.jobs = jobs  # Worker processes for script analysis
+        self.fail_fast = fail_fast  # Stop at the first CRITICAL finding
+        self.findings: List[Finding] = []
         self.all_imports = set()  # Track all imports across files
 
+        # Populated by a single walk of the skill tree in _collect_files()
+        self._script_files: List[Path] = []
+        self._reference_files: List[Path] = []
+        self._asset_files: List[Path] = []
+        self._py_files: List[Path] = []
+        # (has input source, has dangerous sink) per .py file, recorded while
+        # the file is open for script analysis so cross-file analysis need not
+        # read it again
+        self._data_flow: Dict[Path, Tuple[bool, bool]] = {}
+
     def scan(self) -> Dict:
         """Run comprehensive security scan"""
         print(f"[*] Scanning skill at: {self.skill_path}", file=sys.stderr)
@@ -36,83 +520,165 @@ class EnhancedSecurityScanner:
         if not self.skill_path.exists():
             raise ValueError(f"Skill path does not exist: {self.skill_path}")
 
-        # Phase 1: Structural analysis
-        self._check_skill_structure()
-        
-        # Phase 2: Content scanning
-        self._scan_yaml_frontmatter_enhanced()
-        self._scan_all_files()  # Changed to scan ALL files
-        
-        # Phase 3: Cross-file analysis
-        self._analyze_imports()
-        self._check_network_operations()
-        self._check_file_operations()
-        
-        # Phase 4: Advanced patterns
-        self._cross_file_analysis()
+        self._collect_files()
+
+        try:
+            # Phase 1: Structural analysis
+            self._check_skill_structure()
+            self._stop_on_critical(self.findings)
+
+            # Phase 2: Content scanning
+            self._scan_yaml_frontmatter_enhanced()
+            self._stop_on_critical(self.findings)
+            self._scan_all_files()  # Changed to scan ALL files
+
+            # Phase 3: Cross-file analysis
+            self._analyze_imports()
+            self._check_network_operations()
+            self._check_file_operations()
+            self._stop_on_critical(self.findings)
+
+            # Phase 4: Advanced patterns
+            self._cross_file_analysis()
+        except _CriticalHit:
+            print("[!] CRITICAL finding, skipping remaining checks (--fail-fast)", file=sys.stderr)
 
         # Generate report
         report = self._generate_report()
         return report
 
+    def _stop_on_critical(self, findings: List[Finding]):
+        """Under --fail-fast, abandon the scan if findings include a CRITICAL one"""
+        if self.fail_fast and any(finding.severity == self.CRITICAL for finding in findings):
+            raise _CriticalHit
+
+    def _collect_files(self):
+        """Walk the skill tree once and sort files into the lists each check consumes"""
+        # A symlinked top-level directory is followed, as Path.rglob() followed
+        # a symlinked scripts/ or references/. Deeper symlinked directories
+        # are followed only when they stay inside the skill, so the walk
+        # cannot escape into the rest of the filesystem. Each directory is
+        # entered once per top-level directory (which decides how its files
+        # are scanned), so link cycles cannot make the walk loop.
+        skill_root = self.skill_path.resolve()
+        visited = set()
+        pending = [self.skill_path]
+        while pending:
+            directory = pending.pop()
+            subdirs = []
+            try:
+                stat = directory.stat()
+                key = (directory.relative_to(self.skill_path).parts[:1], stat.st_dev, stat.st_ino)
+                if key in visited:
+                    continue
+                visited.add(key)
+
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            path = Path(entry.path)
+                            if (entry.is_symlink() and directory != self.skill_path
+                                    and not path.resolve().is_relative_to(skill_root)):
+                                continue
+                            subdirs.append(path)
+                        elif entry.is_file():
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                continue
+                            self._classify_file(Path(entry.path), size)
+            except OSError:
+                continue
+            # Depth-first, pre-order: the same order Path.rglob() yields
+            pending.extend(reversed(subdirs))
+
+    def _classify_file(self, path: Path, size: int):
+        """Record a file under every check that needs to read it"""
+        relative_path = path.relative_to(self.skill_path)
+        top_dir = relative_path.parts[0]
+
+        # Assets are only sniffed for an executable header, whatever their size
+        if top_dir == "assets":
+            self._asset_files.append(path)
+
+        if size > _MAX_SCAN_BYTES:
+            # Binaries are skipped silently, as they would be when scanning.
+            # An unscanned script forces a review, or padding a malicious
+            # script past the limit would be enough to get it approved
+            if (top_dir in ("scripts", "references") or path.suffix == ".py") and self._is_text_file(path):
+                self.findings.append(Finding(
+                    severity=self.HIGH if top_dir == "scripts" else self.MEDIUM,
+                    category="File Access",
+                    title=f"File too large to scan: {path.name}",
+                    description=f"{size} bytes exceeds the {_MAX_SCAN_BYTES // (1024 * 1024)} MB scan limit",
+                    location=str(relative_path),
+                    impact="Unable to analyze for security issues"
+                ))
+            return
+
+        if top_dir == "scripts":
+            self._script_files.append(path)
+        elif top_dir == "references":
+            self._reference_files.append(path)
+
+        if path.suffix == ".py":
+            self._py_files.append(path)
+
     def _check_skill_structure(self):
         """Verify skill has expected structure"""
         skill_md = self.skill_path / "SKILL.md"
 
         if not skill_md.exists():
-            self.findings.append({
-                "severity": self.CRITICAL,
-                "category": "Structure",
-                "title": "Missing SKILL.md",
-                "description": "Required SKILL.md file not found",
-                "location": str(self.skill_path),
-                "impact": "Skill cannot function without SKILL.md"
-            })
+            self.findings.append(Finding(
+                severity=self.CRITICAL,
+                category="Structure",
+                title="Missing SKILL.md",
+                description="Required SKILL.md file not found",
+                location=str(self.skill_path),
+                impact="Skill cannot function without SKILL.md"
+            ))
 
-    def _scan_yaml_frontmatter_enhanced(self):
-        """Enhanced YAML frontmatter analysis with actual parsing"""
+    @cached_property
+    def _skill_md_text(self) -> Optional[str]:
+        """SKILL.md contents, read once for the frontmatter and markdown scans (None if missing)"""
         skill_md = self.skill_path / "SKILL.md"
-
         if not skill_md.exists():
-            return
+            return None
+        return skill_md.read_text(encoding='utf-8')
 
-        content = skill_md.read_text(encoding='utf-8')
+    def _scan_yaml_frontmatter_enhanced(self):
+        """Enhanced YAML frontmatter analysis with actual parsing"""
+        content = self._skill_md_text
+        if content is None:
+            return
 
         # Extract frontmatter
-        frontmatter_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+        frontmatter_match = _FRONTMATTER_RE.match(content)
 
         if not frontmatter_match:
-            self.findings.append({
-                "severity": self.HIGH,
-                "category": "YAML",
-                "title": "Missing YAML frontmatter",
-                "description": "SKILL.md missing required YAML frontmatter",
-                "location": "SKILL.md:1",
-                "impact": "Skill metadata cannot be parsed"
-            })
+            self.findings.append(Finding(
+                severity=self.HIGH,
+                category="YAML",
+                title="Missing YAML frontmatter",
+                description="SKILL.md missing required YAML frontmatter",
+                location="SKILL.md:1",
+                impact="Skill metadata cannot be parsed"
+            ))
             return
 
         frontmatter_text = frontmatter_match.group(1)
 
         # First: Regex patterns for quick detection
-        dangerous_patterns = [
-            (r'!\s*<', "YAML tag directive (potential code execution)"),
-            (r'__proto__', "Prototype pollution attempt"),
-            (r'!!python', "Python object deserialization"),
-            (r'eval\(', "Eval function call in YAML"),
-            (r'exec\(', "Exec function call in YAML"),
-        ]
-
-        for pattern, desc in dangerous_patterns:
-            if re.search(pattern, frontmatter_text, re.IGNORECASE):
-                self.findings.append({
-                    "severity": self.CRITICAL,
-                    "category": "YAML Injection",
-                    "title": f"Dangerous YAML pattern: {desc}",
-                    "description": f"YAML frontmatter contains '{pattern}' which could execute code",
-                    "location": "SKILL.md frontmatter",
-                    "impact": "Arbitrary code execution during skill parsing"
-                })
+        for pattern, desc in _YAML_DANGEROUS:
+            if pattern.search(frontmatter_text):
+                self.findings.append(Finding(
+                    severity=self.CRITICAL,
+                    category="YAML Injection",
+                    title=f"Dangerous YAML pattern: {desc}",
+                    description=f"YAML frontmatter contains '{pattern.pattern}' which could execute code",
+                    location="SKILL.md frontmatter",
+                    impact="Arbitrary code execution during skill parsing"
+                ))
 
         # Second: Actually parse YAML safely
         try:
@@ -123,39 +689,36 @@ class EnhancedSecurityScanner:
                 self._check_yaml_keys_recursive(parsed, "SKILL.md frontmatter")
                 
         except yaml.constructor.ConstructorError as e:
-            self.findings.append({
-                "severity": self.CRITICAL,
-                "category": "YAML Injection",
-                "title": "YAML attempts to construct Python objects",
-                "description": f"Error: {str(e)}",
-                "location": "SKILL.md frontmatter",
-                "impact": "Arbitrary code execution via YAML deserialization"
-            })
+            self.findings.append(Finding(
+                severity=self.CRITICAL,
+                category="YAML Injection",
+                title="YAML attempts to construct Python objects",
+                description=f"Error: {str(e)}",
+                location="SKILL.md frontmatter",
+                impact="Arbitrary code execution via YAML deserialization"
+            ))
         except yaml.YAMLError as e:
-            self.findings.append({
-                "severity": self.HIGH,
-                "category": "YAML",
-                "title": "Malformed YAML frontmatter",
-                "description": f"Parse error: {str(e)}",
-                "location": "SKILL.md frontmatter",
-                "impact": "Skill may fail to load or contains obfuscated content"
-            })
+            self.findings.append(Finding(
+                severity=self.HIGH,
+                category="YAML",
+                title="Malformed YAML frontmatter",
+                description=f"Parse error: {str(e)}",
+                location="SKILL.md frontmatter",
+                impact="Skill may fail to load or contains obfuscated content"
+            ))
 
     def _check_yaml_keys_recursive(self, data, location: str):
         """Recursively check YAML structure for dangerous keys"""
-        suspicious_keys = ['__proto__', 'constructor', 'prototype', 
-                          'exec', 'eval', 'system', '__class__', '__init__']
-        
         if isinstance(data, dict):
             for key in data.keys():
-                if key in suspicious_keys:
-                    self.findings.append({
-                        "severity": self.CRITICAL,
-                        "category": "YAML Injection",
-                        "title": f"Suspicious YAML key: {key}",
-                        "location": location,
-                        "impact": "Potential prototype pollution or code execution"
-                    })
+                if key in _SUSPICIOUS_YAML_KEYS:
+                    self.findings.append(Finding(
+                        severity=self.CRITICAL,
+                        category="YAML Injection",
+                        title=f"Suspicious YAML key: {key}",
+                        location=location,
+                        impact="Potential prototype pollution or code execution"
+                    ))
                 
                 # Recurse into values
                 self._check_yaml_keys_recursive(data[key], location)
@@ -168,9 +731,7 @@ class EnhancedSecurityScanner:
         """Heuristic to detect if file is text"""
         try:
             # Exclude obvious binaries by extension
-            binary_exts = {'.pyc', '.so', '.dll', '.exe', '.bin', '.dat', 
-                          '.png', '.jpg', '.jpeg', '.gif', '.ico', '.zip', '.tar', '.gz'}
-            if path.suffix.lower() in binary_exts:
+            if path.suffix.lower() in _BINARY_SUFFIXES:
                 return False
             
             # Read first 8KB
@@ -193,18 +754,27 @@ class EnhancedSecurityScanner:
     def _scan_all_files(self):
         """Scan ALL text files, not just known extensions"""
         # Scan scripts directory with ALL files
-        scripts_dir = self.skill_path / "scripts"
-        if scripts_dir.exists():
-            for file_path in scripts_dir.rglob("*"):
-                if file_path.is_file() and self._is_text_file(file_path):
-                    self._analyze_script(file_path)
+        scripts = [file_path for file_path in self._script_files if self._is_text_file(file_path)]
+        if self.jobs > 1 and len(scripts) >= _MIN_PARALLEL_SCRIPTS:
+            # Findings depend only on each file's contents, so scripts are
+            # analyzed in worker processes; map() keeps them in file order
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                for findings, data_flow in pool.map(_analyze_script_file, repeat(self.skill_path), scripts,
+                                                    repeat(self.fail_fast), chunksize=8):
+                    self.findings.extend(findings)
+                    self._data_flow.update(data_flow)
+                    if self.fail_fast and any(finding.severity == self.CRITICAL for finding in findings):
+                        # Leaving the block would otherwise wait for every queued script
+                        pool.shutdown(cancel_futures=True)
+                        raise _CriticalHit
+        else:
+            for file_path in scripts:
+                self._analyze_script(file_path)
         
         # Scan references for hidden code
-        refs_dir = self.skill_path / "references"
-        if refs_dir.exists():
-            for file_path in refs_dir.rglob("*"):
-                if file_path.is_file() and self._is_text_file(file_path):
-                    self._scan_reference_file(file_path)
+        for file_path in self._reference_files:
+            if self._is_text_file(file_path):
+                self._scan_reference_file(file_path)
         
         # Scan SKILL.md for embedded code
         self._scan_markdown_for_code()
@@ -215,19 +785,23 @@ class EnhancedSecurityScanner:
     def _analyze_script(self, script_path: Path):
         """Analyze individual script for vulnerabilities"""
         try:
-            content = script_path.read_text(encoding='utf-8')
+            content = _read_mapped(script_path)
         except Exception as e:
-            self.findings.append({
-                "severity": self.MEDIUM,
-                "category": "File Access",
-                "title": f"Cannot read file: {script_path.name}",
-                "description": f"Error: {e}",
-                "location": str(script_path),
-                "impact": "Unable to analyze for security issues"
-            })
+            self.findings.append(Finding(
+                severity=self.MEDIUM,
+                category="File Access",
+                title=f"Cannot read file: {script_path.name}",
+                description=f"Error: {e}",
+                location=str(script_path),
+                impact="Unable to analyze for security issues"
+            ))
             return
 
+        if _NON_ASCII_RE.search(content):
+            content = _nfkc_normalized(content)
+
         relative_path = script_path.relative_to(self.skill_path)
+        line_starts = _line_starts(content)
 
         # Original checks
         self._check_command_injection(content, relative_path)
@@ -236,309 +810,154 @@ class EnhancedSecurityScanner:
         self._check_obfuscation(content, relative_path)
         self._check_hardcoded_secrets(content, relative_path)
         
-        # NEW: Enhanced checks
-        self._check_indirect_execution(content, relative_path)
-        self._check_advanced_obfuscation(content, relative_path)
-        self._check_shell_injection(content, relative_path)
-        self._check_time_bombs(content, relative_path)
-        self._check_environment_manipulation(content, relative_path)
-
-    def _check_indirect_execution(self, content: str, file_path: Path):
-        """Detect indirect code execution via getattr, __import__, etc."""
-        
-        patterns = [
-            # getattr patterns
-            (r'getattr\s*\([^,]+,\s*[\'"][^\'"]*(?:system|exec|eval|compile|open)[^\'"]*[\'"]', 
-             self.CRITICAL, "getattr accessing dangerous function names"),
-            
-            # String concatenation to build function names
-            (r'getattr\s*\([^,]+,\s*[^)]*\+[^)]*\)',
-             self.CRITICAL, "Dynamic function name via string concatenation"),
-            
-            # __builtins__ manipulation
-            (r'__builtins__\s*\[|getattr\s*\(__builtins__',
-             self.CRITICAL, "__builtins__ manipulation"),
-            
-            # Class traversal (sandbox escape)
-            (r'__class__\.__base__\.__subclasses__',
-             self.CRITICAL, "Class hierarchy traversal (sandbox escape pattern)"),
-            
-            # Dictionary-based execution
-            (r'\{[^}]*[\'"](?:exec|eval|system)[\'"][^}]*\}\[',
-             self.CRITICAL, "Dictionary-based function call obfuscation"),
-            
-            # Lambda with dangerous functions
-            (r'lambda[^:]*:\s*(?:exec|eval|__import__|getattr)',
-             self.HIGH, "Lambda wrapping dangerous operations"),
-            
-            # importlib with concatenation
-            (r'importlib\.import_module\s*\([^)]*\+[^)]*\)',
-             self.CRITICAL, "Dynamic module import with string manipulation"),
-        ]
-        
-        for pattern, severity, desc in patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                line_num = content[:match.start()].count('\n') + 1
-                self.findings.append({
-                    "severity": severity,
-                    "category": "Obfuscated Execution",
-                    "title": desc,
-                    "location": f"{file_path}:{line_num}",
-                    "evidence": self._get_code_context(content, match.start()),
-                    "impact": "Code execution via obfuscation/indirection"
-                })
-
-    def _check_advanced_obfuscation(self, content: str, file_path: Path):
-        """Detect multiple encoding/obfuscation schemes"""
-        
-        patterns = [
-            # Compression
-            (r'zlib\.decompress|gzip\.decompress|bz2\.decompress',
-             self.HIGH, "Compressed payload detected"),
-            
-            # URL encoding
-            (r'urllib\.parse\.unquote|quote_plus\(',
-             self.MEDIUM, "URL-encoded content"),
-            
-            # ROT13/Caesar cipher
-            (r'codecs\.decode\([^,]+,\s*[\'"]rot',
-             self.HIGH, "ROT cipher encoding"),
-            
-            # XOR encoding
-            (r'chr\s*\(\s*ord\([^)]+\)\s*\^',
-             self.HIGH, "XOR encoding pattern"),
-            
-            # Hex to bytes
-            (r'bytes\.fromhex\(|bytearray\.fromhex\(',
-             self.MEDIUM, "Hex-to-bytes conversion"),
-            
-            # AST manipulation
-            (r'ast\.parse\([^)]+\).*?ast\.\w+\s*=',
-             self.HIGH, "AST manipulation (code rewriting)"),
-            
-            # Deserialization
-            (r'marshal\.loads|pickle\.loads|yaml\.(?:load|unsafe_load)\(',
-             self.CRITICAL, "Unsafe deserialization"),
-        ]
-        
-        for pattern, severity, desc in patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                line_num = content[:match.start()].count('\n') + 1
-                
+        # NEW: Enhanced checks, reported in their original order: indirect
+        # execution, advanced obfuscation, shell injection, time bombs, then
+        # environment manipulation
+        candidates = _script_candidates(content)
+        split = bisect.bisect_left(candidates, _ENV_PATTERNS_START)
+        self._check_script_patterns(content, relative_path, line_starts, candidates[:split])
+        self._check_time_bombs(content, relative_path, line_starts)
+        self._check_script_patterns(content, relative_path, line_starts, candidates[split:])
+
+        if script_path.suffix == ".py":
+            self._data_flow[script_path] = _data_flow_flags(content)
+
+    def _check_script_patterns(self, content: bytes, file_path: Path, line_starts: List[int],
+                               indexes: List[int]):
+        """Run the per-match script checks of the given patterns, in order"""
+        # Each candidate pattern scans the whole file on its own, which keeps
+        # the scan linear under RE2 however many prefixes the file contains
+        for index in indexes:
+            pattern, severity, category, title, impact, escalate = _SCRIPT_PATTERNS[index]
+            for match in pattern.finditer(content):
+                start = match.start()
+                line_num = bisect.bisect_right(line_starts, start)
+
                 # Check if exec/eval nearby (within 5 lines)
-                context = self._get_code_context(content, match.start(), 0, 5)
-                if re.search(r'exec|eval', context):
-                    severity = self.CRITICAL
-                
-                self.findings.append({
-                    "severity": severity,
-                    "category": "Code Obfuscation",
-                    "title": desc,
-                    "location": f"{file_path}:{line_num}",
-                    "evidence": self._get_code_context(content, match.start()),
-                    "impact": "Obfuscated code hiding potential payload"
-                })
-
-    def _check_shell_injection(self, content: str, file_path: Path):
-        """Detect shell injection even without shell=True"""
-        
-        shell_patterns = [
-            r'subprocess\.\w+\s*\(\s*\[\s*[\'"](?:/bin/)?(?:bash|sh|zsh|ksh)[\'"]',
-            r'subprocess\.\w+\s*\(\s*\[\s*[\'"](?:python|python3)[\'"],\s*[\'"]-c[\'"]',
-            r'subprocess\.\w+\s*\(\s*\[\s*[\'"]perl[\'"],\s*[\'"]-e[\'"]',
-            r'subprocess\.\w+\s*\(\s*\[\s*[\'"]ruby[\'"],\s*[\'"]-e[\'"]',
-            r'subprocess\.\w+\s*\(\s*\[\s*[\'"]awk[\'"].*system',
-            r'subprocess\.\w+\s*\(\s*\[\s*[\'"]jq[\'"].*@sh',
-            r'subprocess\.\w+\s*\(\s*\[\s*[\'"]sed[\'"].*e[\'"]',
-        ]
-        
-        for pattern in shell_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                line_num = content[:match.start()].count('\n') + 1
-                
-                self.findings.append({
-                    "severity": self.CRITICAL,
-                    "category": "Shell Injection",
-                    "title": "Shell/interpreter invocation with injection risk",
-                    "location": f"{file_path}:{line_num}",
-                    "evidence": self._get_code_context(content, match.start()),
-                    "impact": "Shell spawned; command injection if user input reaches arguments"
-                })
-
-    def _check_time_bombs(self, content: str, file_path: Path):
+                finding_severity = severity
+                if escalate and _EXEC_EVAL_RE.search(self._get_code_context(content, start, line_starts, 0, 5)):
+                    finding_severity = self.CRITICAL
+
+                self.findings.append(Finding(
+                    severity=finding_severity,
+                    category=category,
+                    title=title,
+                    location=f"{file_path}:{line_num}",
+                    evidence=self._get_code_context(content, start, line_starts),
+                    impact=impact
+                ))
+                if self.fail_fast and finding_severity == self.CRITICAL:
+                    raise _CriticalHit
+
+    def _check_time_bombs(self, content: bytes, file_path: Path, line_starts: List[int]):
         """Detect time-based conditional execution"""
         
-        time_patterns = [
-            r'datetime\..*\.(?:day|month|year|hour|minute)',
-            r'time\.time\(\)\s*[><=]',
-            r'if\s+.*datetime\.',
-            r'time\.sleep\([^)]*\).*(?:os\.system|subprocess|exec|eval)',
-        ]
-        
-        for pattern in time_patterns:
-            for match in re.finditer(pattern, content):
+        for pattern in _TIME_BOMBS:
+            for match in pattern.finditer(content):
                 # Get surrounding context
-                context = self._get_code_context(content, match.start(), 2, 10)
+                context = self._get_code_context(content, match.start(), line_starts, 2, 10)
                 
                 # Check if dangerous operations appear nearby
-                if re.search(r'os\.system|subprocess|exec|eval|requests\.(post|get)|urllib|socket', 
-                            context, re.IGNORECASE):
-                    line_num = content[:match.start()].count('\n') + 1
+                if _TIME_BOMB_SINK_RE.search(context):
+                    line_num = bisect.bisect_right(line_starts, match.start())
                     
-                    self.findings.append({
-                        "severity": self.HIGH,
-                        "category": "Time Bomb",
-                        "title": "Time-based conditional near dangerous operation",
-                        "location": f"{file_path}:{line_num}",
-                        "evidence": context,
-                        "impact": "Code may activate at specific time (time bomb pattern)"
-                    })
+                    self.findings.append(Finding(
+                        severity=self.HIGH,
+                        category="Time Bomb",
+                        title="Time-based conditional near dangerous operation",
+                        location=f"{file_path}:{line_num}",
+                        evidence=context,
+                        impact="Code may activate at specific time (time bomb pattern)"
+                    ))
                     break  # Only report once per time pattern
 
-    def _check_environment_manipulation(self, content: str, file_path: Path):
-        """Detect dangerous environment variable manipulation"""
-        
-        dangerous_env_patterns = [
-            (r'os\.environ\[[\'"](?:LD_PRELOAD|LD_LIBRARY_PATH)[\'"]',
-             "LD_PRELOAD/LD_LIBRARY_PATH manipulation (library hijacking)"),
-            (r'os\.environ\[[\'"]PATH[\'"]',
-             "PATH manipulation (command hijacking)"),
-            (r'os\.environ\[[\'"]PYTHONPATH[\'"]',
-             "PYTHONPATH manipulation (module hijacking)"),
-            (r'os\.putenv\(',
-             "Direct environment modification via putenv"),
-        ]
-        
-        for pattern, desc in dangerous_env_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                line_num = content[:match.start()].count('\n') + 1
-                
-                self.findings.append({
-                    "severity": self.HIGH,
-                    "category": "Environment Manipulation",
-                    "title": desc,
-                    "location": f"{file_path}:{line_num}",
-                    "evidence": self._get_code_context(content, match.start()),
-                    "impact": "Can hijack library/command loading mechanisms"
-                })
-
     def _analyze_imports(self):
         """Analyze all imports for typosquatting"""
-        
-        # Common legitimate packages
-        legit_packages = {
-            'requests', 'urllib', 'beautifulsoup4', 'bs4', 'lxml',
-            'numpy', 'pandas', 'matplotlib', 'scipy', 'sklearn',
-            'flask', 'django', 'fastapi', 'sqlalchemy',
-            'pytest', 'unittest', 'mock', 'click', 'pyyaml',
-        }
-        
-        # Known typosquats
-        typosquat_map = {
-            'request': 'requests',
-            'urlib': 'urllib',
-            'numppy': 'numpy',
-            'beatifulsoup': 'beautifulsoup4',
-            'scikit-learn': 'sklearn',
-        }
-        
         for imp in self.all_imports:
             base_module = imp.split('.')[0]
             
             # Check known typosquats
-            if base_module in typosquat_map:
-                self.findings.append({
-                    "severity": self.CRITICAL,
-                    "category": "Supply Chain",
-                    "title": f"Known typosquat detected: {base_module}",
-                    "description": f"Did you mean '{typosquat_map[base_module]}'?",
-                    "location": "Imports",
-                    "impact": "Malicious package impersonating legitimate library"
-                })
+            if base_module in _TYPOSQUATS:
+                self.findings.append(Finding(
+                    severity=self.CRITICAL,
+                    category="Supply Chain",
+                    title=f"Known typosquat detected: {base_module}",
+                    description=f"Did you mean '{_TYPOSQUATS[base_module]}'?",
+                    location="Imports",
+                    impact="Malicious package impersonating legitimate library"
+                ))
 
     def _scan_reference_file(self, file_path: Path):
         """Scan reference documentation for hidden code"""
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = _read_mapped(file_path)
             
             # Check for code in HTML comments
-            html_comment_code = re.search(r'<!--.*?(?:exec|eval|os\.system|import os).*?-->', 
-                                         content, re.DOTALL | re.IGNORECASE)
+            html_comment_code = _html_comment_with_code(content)
             if html_comment_code:
-                self.findings.append({
-                    "severity": self.HIGH,
-                    "category": "Hidden Code",
-                    "title": "Executable code in HTML comment",
-                    "location": str(file_path.relative_to(self.skill_path)),
-                    "evidence": html_comment_code.group()[:200],
-                    "impact": "Code hidden in documentation comments"
-                })
+                self.findings.append(Finding(
+                    severity=self.HIGH,
+                    category="Hidden Code",
+                    title="Executable code in HTML comment",
+                    location=str(file_path.relative_to(self.skill_path)),
+                    evidence=html_comment_code.decode('utf-8', 'replace')[:200],
+                    impact="Code hidden in documentation comments"
+                ))
             
             # Check for code in markdown code blocks
             if file_path.suffix == '.md':
-                code_blocks = re.findall(r'```(?:python|bash|sh)\n(.*?)```', content, re.DOTALL)
-                for block in code_blocks:
-                    if re.search(r'exec\(|eval\(|os\.system\(|subprocess\..*shell\s*=\s*True', block):
-                        self.findings.append({
-                            "severity": self.MEDIUM,
-                            "category": "Documentation",
-                            "title": "Dangerous code in documentation example",
-                            "location": str(file_path.relative_to(self.skill_path)),
-                            "impact": "Verify this is example code, not executable"
-                        })
+                for block in _REF_CODE_BLOCK_RE.finditer(content):
+                    if _REF_DANGEROUS_CODE_RE.search(content, block.start(1), block.end(1)):
+                        self.findings.append(Finding(
+                            severity=self.MEDIUM,
+                            category="Documentation",
+                            title="Dangerous code in documentation example",
+                            location=str(file_path.relative_to(self.skill_path)),
+                            impact="Verify this is example code, not executable"
+                        ))
         except Exception:
             pass
 
     def _scan_markdown_for_code(self):
         """Scan SKILL.md for hidden executable code"""
-        skill_md = self.skill_path / "SKILL.md"
-        if not skill_md.exists():
+        content = self._skill_md_text
+        if content is None:
             return
-        
-        content = skill_md.read_text(encoding='utf-8')
-        
-        # Skip frontmatter
-        content = re.sub(r'^---\n.*?\n---\n', '', content, flags=re.DOTALL)
-        
+
+        # Skip frontmatter by starting the search after it rather than copying the rest
+        frontmatter = _FRONTMATTER_BLOCK_RE.match(content)
+        body_start = frontmatter.end() if frontmatter else 0
+
         # Check for suspicious code blocks
-        code_blocks = re.findall(r'```.*?\n(.*?)```', content, re.DOTALL)
-        for block in code_blocks:
-            if re.search(r'exec\(|eval\(|__import__|getattr.*system', block):
-                self.findings.append({
-                    "severity": self.HIGH,
-                    "category": "Documentation",
-                    "title": "Dangerous code pattern in SKILL.md",
-                    "location": "SKILL.md",
-                    "impact": "Verify this is documentation, not executable instruction"
-                })
+        for block in _MD_CODE_BLOCK_RE.finditer(content, body_start):
+            if _MD_DANGEROUS_CODE_RE.search(content, block.start(1), block.end(1)):
+                self.findings.append(Finding(
+                    severity=self.HIGH,
+                    category="Documentation",
+                    title="Dangerous code pattern in SKILL.md",
+                    location="SKILL.md",
+                    impact="Verify this is documentation, not executable instruction"
+                ))
 
     def _scan_assets_enhanced(self):
         """Enhanced asset scanning for polyglots and hidden executables"""
-        assets_dir = self.skill_path / "assets"
-        
-        if not assets_dir.exists():
+        if not self._asset_files:
             return
-        
-        for asset_file in assets_dir.rglob("*"):
-            if not asset_file.is_file():
-                continue
-            
-            # Check executable headers
-            try:
-                with open(asset_file, 'rb') as f:
-                    header = f.read(4)
-                
-                # Executable signatures
-                if header in [b'\x7fELF', b'MZ\x90\x00', b'\xca\xfe\xba\xbe']:
-                    self.findings.append({
-                        "severity": self.CRITICAL,
-                        "category": "Assets",
-                        "title": f"Executable file: {asset_file.name}",
-                        "location": str(asset_file.relative_to(self.skill_path)),
-                        "impact": "Binary executable in assets directory"
-                    })
-            except Exception:
-                pass
+
+        # Check executable headers, reading them concurrently
+        with ThreadPoolExecutor(max_workers=min(_ASSET_READERS, len(self._asset_files))) as pool:
+            formats = list(pool.map(_executable_format, self._asset_files))
+
+        for asset_file, executable_format in zip(self._asset_files, formats):
+            if executable_format:
+                self.findings.append(Finding(
+                    severity=self.CRITICAL,
+                    category="Assets",
+                    title=f"Executable file: {asset_file.name}",
+                    description=f"{executable_format} executable header",
+                    location=str(asset_file.relative_to(self.skill_path)),
+                    impact="Binary executable in assets directory"
+                ))
 
     def _cross_file_analysis(self):
         """Analyze patterns across multiple files"""
@@ -546,29 +965,32 @@ class EnhancedSecurityScanner:
         files_with_input = []
         files_with_sinks = []
         
-        for script_file in self.skill_path.rglob("*.py"):
+        for script_file in self._py_files:
             try:
-                content = script_file.read_text(encoding='utf-8')
-                
+                # Scripts were flagged during script analysis; only .py files
+                # elsewhere in the skill are read here
+                flags = self._data_flow.get(script_file)
+                has_input, has_sink = flags if flags else _data_flow_flags(_read_mapped(script_file))
+
                 # Check for input sources
-                if re.search(r'input\(|sys\.argv|os\.environ|request\.(args|form|json)', content):
+                if has_input:
                     files_with_input.append(script_file.name)
-                
+
                 # Check for dangerous sinks
-                if re.search(r'os\.system|subprocess\.|exec\(|eval\(', content):
+                if has_sink:
                     files_with_sinks.append(script_file.name)
             except:
                 pass
         
         if files_with_input and files_with_sinks:
-            self.findings.append({
-                "severity": self.HIGH,
-                "category": "Data Flow",
-                "title": "User input and dangerous operations in skill",
-                "description": f"Input in: {files_with_input}, Sinks in: {files_with_sinks}",
-                "location": "Multiple files",
-                "impact": "Verify input validation before dangerous operations"
-            })
+            self.findings.append(Finding(
+                severity=self.HIGH,
+                category="Data Flow",
+                title="User input and dangerous operations in skill",
+                description=f"Input in: {files_with_input}, Sinks in: {files_with_sinks}",
+                location="Multiple files",
+                impact="Verify input validation before dangerous operations"
+            ))
 
     # [Include original helper methods: _check_command_injection, _check_data_exfiltration, 
     #  _check_credential_theft, _check_obfuscation, _check_hardcoded_secrets,
@@ -603,36 +1025,29 @@ class EnhancedSecurityScanner:
         # Original implementation
         pass
     
-    def _get_code_context(self, content: str, position: int, lines_before=1, lines_after=1) -> str:
-        """Get code context around a position"""
-        line_start = position
-        for _ in range(lines_before):
-            prev_newline = content.rfind('\n', 0, line_start)
-            if prev_newline != -1:
-                line_start = prev_newline
-
-        line_end = position
-        for _ in range(lines_after):
-            next_newline = content.find('\n', line_end + 1)
-            if next_newline != -1:
-                line_end = next_newline
-            else:
-                break
+    def _get_code_context(self, content: bytes, position: int, line_starts: List[int],
+                          lines_before=1, lines_after=1) -> str:
+        """Get code context around a position: lines_before/lines_after count the matched line itself"""
+        line = bisect.bisect_right(line_starts, position) - 1
+
+        if lines_before:
+            line_start = line_starts[max(line - lines_before + 1, 0)]
+        else:
+            line_start = position
+
+        if lines_after:
+            last = line + lines_after
+            line_end = line_starts[last] - 1 if last < len(line_starts) else len(content)
+        else:
+            line_end = position
 
-        context = content[line_start:line_end].strip()
-        return context[:200] + '...' if len(context) > 200 else context
+        # Only the context window is decoded, never the whole file
+        context = content[line_start:line_end].decode('utf-8', 'replace').strip()
+        return context if len(context) <= 200 else context[:200] + '...'
 
     def _generate_report(self) -> Dict:
         """Generate security report"""
-        severity_counts = {
-            self.CRITICAL: 0,
-            self.HIGH: 0,
-            self.MEDIUM: 0,
-            self.LOW: 0
-        }
-
-        for finding in self.findings:
-            severity_counts[finding['severity']] += 1
+        severity_counts = Counter(finding.severity for finding in self.findings)
 
         # Determine overall risk
         if severity_counts[self.CRITICAL] > 0:
@@ -665,12 +1080,29 @@ class EnhancedSecurityScanner:
                 "low": severity_counts[self.LOW],
                 "recommendation": recommendation
             },
-            "findings": self.findings
+            "findings": [finding.to_dict() for finding in self.findings]
         }
 
         return report
 
 
+def _analyze_script_file(skill_path: Path, script_path: Path,
+                         fail_fast: bool = False) -> Tuple[List[Finding], Dict[Path, Tuple[bool, bool]]]:
+    """Analyze one script in a fresh scanner; top-level so worker processes can run it"""
+    scanner = EnhancedSecurityScanner(skill_path, fail_fast=fail_fast)
+    try:
+        scanner._analyze_script(script_path)
+    except _CriticalHit:
+        pass  # The parent sees the CRITICAL finding and stops
+    return scanner.findings, scanner._data_flow
+
+
+def _scan_skill(skill_path: Path, verbose: bool, jobs: int, fail_fast: bool = False) -> Dict:
+    """Scan one skill; top-level so worker processes can run it"""
+    scanner = EnhancedSecurityScanner(skill_path, verbose=verbose, jobs=jobs, fail_fast=fail_fast)
+    return scanner.scan()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Enhanced security scanner for Claude Code skills v2.0'
@@ -679,6 +1111,10 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--output', '-o', help='Output JSON file')
     parser.add_argument('--recursive', '-r', action='store_true', help='Scan all skills in directory')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: CPU count, 1 disables parallel scanning)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Stop scanning a skill at its first CRITICAL finding')
 
     args = parser.parse_args()
 
@@ -689,10 +1125,19 @@ def main():
 
     all_reports = []
 
-    for skill_path in skill_paths:
+    # In recursive mode skills are scanned side by side, each one serially;
+    # a single skill spreads its scripts over the workers instead
+    pool = None
+    if len(skill_paths) > 1 and args.jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=min(args.jobs, len(skill_paths)))
+        pending = [pool.submit(_scan_skill, skill_path, args.verbose, 1, args.fail_fast) for skill_path in skill_paths]
+
+    for index, skill_path in enumerate(skill_paths):
         try:
-            scanner = EnhancedSecurityScanner(skill_path, verbose=args.verbose)
-            report = scanner.scan()
+            if pool:
+                report = pending[index].result()
+            else:
+                report = _scan_skill(skill_path, args.verbose, args.jobs, args.fail_fast)
             all_reports.append(report)
 
             print(f"\n{'='*60}", file=sys.stderr)
@@ -706,14 +1151,17 @@ def main():
             print(f"Error scanning {skill_path}: {e}", file=sys.stderr)
             continue
 
+    if pool:
+        pool.shutdown()
+
     output_data = {"scans": all_reports} if args.recursive else (all_reports[0] if all_reports else {})
 
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(_dumps(output_data))
         print(f"\nReport written to: {args.output}", file=sys.stderr)
     else:
-        print(json.dumps(output_data, indent=2))
+        sys.stdout.buffer.write(_dumps(output_data) + b"\n")
 
 
 if __name__ == '__main__':
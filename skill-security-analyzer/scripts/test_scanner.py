@@ -4,11 +4,27 @@ Test Runner for Security Scanner
 Tests scanner against all malicious samples and reports detection rate
 """
 
+import importlib.util
 import sys
 import json
+import tempfile
 from pathlib import Path
 import subprocess
 
+# Frontmatter for the SKILL.md of a skill staged around a script sample
+SAMPLE_SKILL_MD = "---\nname: sample\ndescription: Malicious test sample\n---\n"
+
+
+def stage_sample(skill_dir: Path, sample_file: str, content: bytes):
+    """Lay out a sample as a skill: markdown samples become SKILL.md, others a script"""
+    if sample_file.endswith('.md'):
+        (skill_dir / "SKILL.md").write_bytes(content)
+    else:
+        (skill_dir / "SKILL.md").write_text(SAMPLE_SKILL_MD)
+        (skill_dir / "scripts").mkdir()
+        (skill_dir / "scripts" / sample_file).write_bytes(content)
+
+
 def run_tests():
     """Run scanner against all malicious samples"""
     
@@ -32,47 +48,76 @@ def run_tests():
         '09_exfil.py': ['Network Access'],
         '10_yaml.md': ['YAML Injection'],
         '11_import_hook.py': ['Import Hijacking'],
+        '14_unicode_fullwidth.py': ['Shell Injection'],
+        '15_unicode_long_s.py': ['Shell Injection'],
+    }
+
+    # Samples built at run time, too large to keep in the repository:
+    # name -> (content, expected patterns, module needed to scan it in time)
+    shell_sample = (test_dir / '04_shell.py').read_bytes()
+    generated_samples = {
+        # Thousands of unterminated getattr( calls in front of a real payload;
+        # backtracking engines take minutes, RE2 scans it in linear time
+        '12_redos.py': (b'x = ' + b'getattr(x' * 30000 + b'\n' + shell_sample, ['Shell Injection'], 're2'),
+        # A script padded past the scanner's size limit must still be reviewed
+        '13_oversized.py': (shell_sample + b'#' * (9 * 1024 * 1024), ['File Access', 'too large'], None),
     }
     
     print("="*70)
     print("SECURITY SCANNER TEST SUITE")
     print("="*70)
     
-    total_samples = len(expected_detections)
+    samples = [
+        (sample_file, test_dir / sample_file, expected_patterns, None)
+        for sample_file, expected_patterns in expected_detections.items()
+    ] + [
+        (sample_file, content, expected_patterns, required)
+        for sample_file, (content, expected_patterns, required) in generated_samples.items()
+    ]
+
+    total_samples = len(samples)
     detected = 0
     failed = []
     
-    for sample_file, expected_patterns in expected_detections.items():
-        sample_path = test_dir / sample_file
-        
-        if not sample_path.exists():
+    for sample_file, sample, expected_patterns, required in samples:
+        if isinstance(sample, Path) and not sample.exists():
             print(f"⚠️  SKIP: {sample_file} (not found)")
             continue
+
+        if required and importlib.util.find_spec(required) is None:
+            print(f"⚠️  SKIP: {sample_file} ({required} not installed)")
+            continue
         
-        # Run scanner on this sample
+        # Run scanner on this sample, staged as a skill of its own
         try:
-            result = subprocess.run(
-                [sys.executable, str(scanner), str(sample_path)],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            with tempfile.TemporaryDirectory() as skill_dir:
+                content = sample.read_bytes() if isinstance(sample, Path) else sample
+                stage_sample(Path(skill_dir), sample_file, content)
+                result = subprocess.run(
+                    [sys.executable, str(scanner), skill_dir],
+                    capture_output=True,
+                    text=True,
+                    timeout=5
+                )
             
             report = json.loads(result.stdout)
             
-            # Check if expected patterns were detected
+            # Check if expected patterns were detected, and that the sample
+            # was not approved
             findings_text = json.dumps(report['findings']).lower()
             detected_count = sum(1 for pattern in expected_patterns 
                                 if pattern.lower() in findings_text)
+            approved = report['summary']['recommendation'] == 'APPROVE'
             
-            if detected_count == len(expected_patterns):
+            if detected_count == len(expected_patterns) and not approved:
                 print(f"✓ PASS: {sample_file}")
                 print(f"   Found: {report['summary']['total_findings']} findings")
                 detected += 1
             else:
                 print(f"✗ FAIL: {sample_file}")
                 print(f"   Expected: {expected_patterns}")
-                print(f"   Found {detected_count}/{len(expected_patterns)} patterns")
+                print(f"   Found {detected_count}/{len(expected_patterns)} patterns, "
+                      f"recommendation {report['summary']['recommendation']}")
                 failed.append(sample_file)
                 
         except subprocess.TimeoutExpired:
@@ -0,0 +1,4 @@
+import subprocess
+
+cmd = input()
+subprocess.ｒun(["bash", "-c", cmd])
@@ -4,36 +4,165 @@ Automated Web Accessibility Checker
 Uses axe-core via Selenium to run WCAG 2.2 Level A/AA automated tests
 
 Usage:
-    python automated_checks.py <url> [--output violations.json]
+    python automated_checks.py <url> [<url> ...] [--output violations.json] [--include-passes]
+                               [--max-nodes 50] [--block-assets] [--full-load]
+
+Several URLs are checked in parallel browser sessions (--workers) and
+written to a single JSON file as {"rules": {...}, "pages": [...]}, one page
+entry per URL, with each rule's help text stored once under "rules".
 
 Requirements:
-    pip install selenium axe-selenium-python webdriver-manager
+    pip install selenium axe-selenium-python
+
+Selenium 4.6+ locates chromedriver itself (Selenium Manager); on older
+versions also install webdriver-manager, or point $CHROMEDRIVER at a driver.
 """
 
 import argparse
+import importlib.resources
 import json
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional
 
 try:
     from selenium import webdriver
     from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.chrome.options import Options
-    from webdriver_manager.chrome import ChromeDriverManager
-    from axe_selenium_python import Axe
+    from selenium.common.exceptions import WebDriverException
+    import axe_selenium_python
 except ImportError as e:
     print(f"Error: Missing required package: {e}", file=sys.stderr)
     print("\nInstall dependencies with:", file=sys.stderr)
-    print("  pip install selenium axe-selenium-python webdriver-manager", file=sys.stderr)
+    print("  pip install selenium axe-selenium-python", file=sys.stderr)
     sys.exit(1)
 
+# Optional: driver lookup for Selenium versions without Selenium Manager
+try:
+    from webdriver_manager.chrome import ChromeDriverManager
+except ImportError:
+    ChromeDriverManager = None
+
+# Optional: several times faster JSON encoding for large results
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# axe rule IDs by POUR principle (heuristic, based on common axe rule naming)
+_POUR_RULES = {
+    # Perceivable (1.x success criteria)
+    'Perceivable': [
+        'image-alt', 'input-image-alt', 'area-alt', 'object-alt',
+        'video-caption', 'audio-caption', 'video-description',
+        'color-contrast', 'color-contrast-enhanced',
+        'aria-hidden-body', 'aria-text',
+        'heading-order', 'p-as-heading',
+        'meta-viewport', 'meta-viewport-large'
+    ],
+    # Operable (2.x success criteria)
+    'Operable': [
+        'accesskeys', 'tabindex', 'focus-order-semantics',
+        'bypass', 'skip-link',
+        'link-in-text-block', 'link-name',
+        'button-name', 'frame-title',
+        'meta-refresh', 'meta-refresh-no-exceptions',
+        'scrollable-region-focusable'
+    ],
+    # Understandable (3.x success criteria)
+    'Understandable': [
+        'html-lang-valid', 'html-has-lang', 'valid-lang',
+        'label', 'label-title-only', 'label-content-name-mismatch',
+        'form-field-multiple-labels',
+        'autocomplete-valid', 'input-button-name'
+    ],
+    # Robust (4.x success criteria)
+    'Robust': [
+        'aria-valid-attr', 'aria-valid-attr-value',
+        'aria-allowed-attr', 'aria-required-attr',
+        'aria-required-children', 'aria-required-parent',
+        'aria-roles', 'aria-allowed-role',
+        'duplicate-id', 'duplicate-id-active', 'duplicate-id-aria',
+        'list', 'listitem', 'definition-list', 'dlitem'
+    ]
+}
+
+# Exact rule ID -> principle, built once
+_RULE_TO_PRINCIPLE = {
+    rule: principle
+    for principle, rules in _POUR_RULES.items()
+    for rule in rules
+}
+
+# Runs axe-core (already injected into the page) with the options passed as
+# the script's first argument, and hands the results back to Selenium
+_AXE_RUN_SCRIPT = (
+    "var callback = arguments[arguments.length - 1];"
+    "axe.run(document, arguments[0]).then(function (results) { callback(results); });"
+)
+
+# Rule metadata repeated on every page's results, moved to the shared
+# "rules" table when several URLs are written together
+_RULE_METADATA_KEYS = ('help', 'description', 'helpUrl', 'tags')
+
+# Subresources axe-core does not need, skipped with --block-assets
+_BLOCKED_ASSET_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3'
+]
+
+# chromedriver path from webdriver-manager, resolved at most once per process
+# and only if Selenium could not find a driver on its own
+_chromedriver_path = None
+
+
+def start_chrome(options: Options) -> Any:
+    """
+    Start Chrome, letting Selenium Manager locate chromedriver
+
+    $CHROMEDRIVER overrides the lookup. If Selenium cannot find a driver
+    (Selenium before 4.6, or Selenium Manager failing), webdriver-manager
+    is used instead when installed.
+
+    Args:
+        options: Chrome options for the session
+
+    Returns:
+        The Chrome WebDriver
+    """
+    global _chromedriver_path
+    path = os.environ.get('CHROMEDRIVER') or _chromedriver_path
+    if path:
+        return webdriver.Chrome(service=Service(path), options=options)
+
+    try:
+        return webdriver.Chrome(options=options)
+    except WebDriverException:
+        if ChromeDriverManager is None:
+            raise
+        print("Selenium could not locate chromedriver, using webdriver-manager...", file=sys.stderr)
+
+    _chromedriver_path = ChromeDriverManager().install()
+    return webdriver.Chrome(service=Service(_chromedriver_path), options=options)
+
 
 class AccessibilityChecker:
     """Automated accessibility checker using axe-core"""
 
-    def __init__(self, headless: bool = True):
+    # axe-core source bundled with axe-selenium-python, read once per process
+    _axe_source: Optional[str] = None
+
+    def __init__(self, headless: bool = True, include_passes: bool = False, max_nodes: int = 50,
+                 block_assets: bool = False, full_load: bool = False):
         self.headless = headless
+        self.include_passes = include_passes
+        self.max_nodes = max_nodes  # Nodes kept per violation; 0 keeps all
+        self.block_assets = block_assets
+        self.full_load = full_load
         self.driver = None
 
     def setup_driver(self):
@@ -44,11 +173,22 @@ class AccessibilityChecker:
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
-
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        if self.block_assets:
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        if not self.full_load:
+            # Return from driver.get() once the DOM is ready instead of
+            # waiting for every image, script and iframe to finish loading
+            chrome_options.set_capability('pageLoadStrategy', 'eager')
+
+        self.driver = start_chrome(chrome_options)
         self.driver.set_window_size(1920, 1080)
 
+        if self.block_assets:
+            # Images, fonts and media only slow the page load; axe-core
+            # inspects the DOM and styles
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_ASSET_URLS})
+
     def check_url(self, url: str) -> Dict[str, Any]:
         """
         Run axe-core accessibility checks on the given URL
@@ -65,24 +205,47 @@ class AccessibilityChecker:
         print(f"Loading {url}...", file=sys.stderr)
         self.driver.get(url)
 
-        # Run axe-core with WCAG 2.2 Level A and AA rules
-        axe = Axe(self.driver)
-
         # Inject and run axe with WCAG 2.2 Level A/AA tags
         print("Running accessibility checks...", file=sys.stderr)
-        axe.inject()
-        results = axe.run(options={
+        self.driver.execute_script(self._get_axe_source())
+        options = {
             'runOnly': {
                 'type': 'tag',
                 'values': ['wcag2a', 'wcag2aa', 'wcag21a', 'wcag21aa', 'wcag22aa']
             }
-        })
+        }
+        if not self.include_passes:
+            # Only violations get full node details; axe skips building the
+            # passes/incomplete/inapplicable node lists, roughly halving run time
+            options['resultTypes'] = ['violations']
+        results = self.driver.execute_async_script(_AXE_RUN_SCRIPT, options)
 
         # Enhance violations with additional metadata
         enhanced_results = self._enhance_results(results, url)
 
         return enhanced_results
 
+    @classmethod
+    def _get_axe_source(cls) -> str:
+        """axe-core JavaScript, read from the axe-selenium-python package on first use"""
+        if cls._axe_source is None:
+            bundle = importlib.resources.files(axe_selenium_python) / 'node_modules' / 'axe-core' / 'axe.min.js'
+            cls._axe_source = bundle.read_text(encoding='utf-8')
+        return cls._axe_source
+
+    def check_urls(self, urls: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Check several URLs in turn, reusing one browser session
+
+        Args:
+            urls: The URLs to check
+
+        Yields:
+            Enhanced results for each URL, in order
+        """
+        for url in urls:
+            yield self.check_url(url)
+
     def _enhance_results(self, results: Dict, url: str) -> Dict[str, Any]:
         """
         Enhance axe results with additional categorization and metadata
@@ -97,6 +260,9 @@ class AccessibilityChecker:
         violations = results.get('violations', [])
         passes = results.get('passes', [])
 
+        # Groups hold indexes into violations rather than copies, since every
+        # violation also carries its level, principle and severity inline
+
         # Categorize violations by WCAG level
         level_a_violations = []
         level_aa_violations = []
@@ -108,7 +274,17 @@ class AccessibilityChecker:
         understandable = []
         robust = []
 
-        for violation in violations:
+        # Categorize by severity, so reports need not re-scan the violations
+        by_severity = {'CRITICAL': [], 'HIGH': [], 'MEDIUM': [], 'LOW': []}
+
+        for index, violation in enumerate(violations):
+            # Keep the node count, but not every node: a single rule can
+            # match thousands of elements on a long page
+            nodes = violation.get('nodes', [])
+            violation['node_count_total'] = len(nodes)
+            if self.max_nodes and len(nodes) > self.max_nodes:
+                violation['nodes'] = nodes[:self.max_nodes]
+
             # Determine WCAG level from tags
             tags = violation.get('tags', [])
             wcag_level = self._get_wcag_level(tags)
@@ -116,28 +292,30 @@ class AccessibilityChecker:
 
             # Add severity mapping
             impact = violation.get('impact', 'moderate')
-            violation['severity'] = self._map_severity(impact)
+            severity = self._map_severity(impact)
+            violation['severity'] = severity
+            by_severity[severity].append(index)
 
             # Categorize by level
             if wcag_level == 'A':
-                level_a_violations.append(violation)
+                level_a_violations.append(index)
             elif wcag_level == 'AA':
-                level_aa_violations.append(violation)
+                level_aa_violations.append(index)
             elif wcag_level == 'AAA':
-                level_aaa_violations.append(violation)
+                level_aaa_violations.append(index)
 
             # Categorize by POUR principle based on success criterion
             principle = self._get_pour_principle(violation.get('id', ''))
             violation['pour_principle'] = principle
 
             if principle == 'Perceivable':
-                perceivable.append(violation)
+                perceivable.append(index)
             elif principle == 'Operable':
-                operable.append(violation)
+                operable.append(index)
             elif principle == 'Understandable':
-                understandable.append(violation)
+                understandable.append(index)
             elif principle == 'Robust':
-                robust.append(violation)
+                robust.append(index)
 
         # Build enhanced results
         enhanced = {
@@ -150,25 +328,31 @@ class AccessibilityChecker:
                 'level_aa_violations': len(level_aa_violations),
                 'level_aaa_violations': len(level_aaa_violations),
                 'total_passes': len(passes),
+                'severity_counts': {severity: len(items) for severity, items in by_severity.items()},
                 'eaa_compliant': len(level_a_violations) == 0 and len(level_aa_violations) == 0
             },
             'violations': {
                 'all': violations,
-                'by_level': {
+                'index_by_level': {
                     'A': level_a_violations,
                     'AA': level_aa_violations,
                     'AAA': level_aaa_violations
                 },
-                'by_principle': {
+                'index_by_principle': {
                     'Perceivable': perceivable,
                     'Operable': operable,
                     'Understandable': understandable,
                     'Robust': robust
-                }
-            },
-            'passes': passes
+                },
+                'index_by_severity': by_severity
+            }
         }
 
+        # Without --include-passes axe still lists every passing rule, but
+        # with at most one node each, so only the count is meaningful
+        if self.include_passes:
+            enhanced['passes'] = passes
+
         return enhanced
 
     def _get_wcag_level(self, tags: List[str]) -> str:
@@ -196,55 +380,15 @@ class AccessibilityChecker:
         Determine POUR principle from axe rule ID
         This is a heuristic mapping based on common axe rule naming
         """
-        # Perceivable (1.x success criteria)
-        perceivable_rules = [
-            'image-alt', 'input-image-alt', 'area-alt', 'object-alt',
-            'video-caption', 'audio-caption', 'video-description',
-            'color-contrast', 'color-contrast-enhanced',
-            'aria-hidden-body', 'aria-text',
-            'heading-order', 'p-as-heading',
-            'meta-viewport', 'meta-viewport-large'
-        ]
-
-        # Operable (2.x success criteria)
-        operable_rules = [
-            'accesskeys', 'tabindex', 'focus-order-semantics',
-            'bypass', 'skip-link',
-            'link-in-text-block', 'link-name',
-            'button-name', 'frame-title',
-            'meta-refresh', 'meta-refresh-no-exceptions',
-            'scrollable-region-focusable'
-        ]
-
-        # Understandable (3.x success criteria)
-        understandable_rules = [
-            'html-lang-valid', 'html-has-lang', 'valid-lang',
-            'label', 'label-title-only', 'label-content-name-mismatch',
-            'form-field-multiple-labels',
-            'autocomplete-valid', 'input-button-name'
-        ]
-
-        # Robust (4.x success criteria)
-        robust_rules = [
-            'aria-valid-attr', 'aria-valid-attr-value',
-            'aria-allowed-attr', 'aria-required-attr',
-            'aria-required-children', 'aria-required-parent',
-            'aria-roles', 'aria-allowed-role',
-            'duplicate-id', 'duplicate-id-active', 'duplicate-id-aria',
-            'list', 'listitem', 'definition-list', 'dlitem'
-        ]
-
-        if any(rule in rule_id for rule in perceivable_rules):
-            return 'Perceivable'
-        elif any(rule in rule_id for rule in operable_rules):
-            return 'Operable'
-        elif any(rule in rule_id for rule in understandable_rules):
-            return 'Understandable'
-        elif any(rule in rule_id for rule in robust_rules):
-            return 'Robust'
-        else:
-            # Default categorization by SC number if present in help URL
-            return 'Unknown'
+        principle = _RULE_TO_PRINCIPLE.get(rule_id)
+        if principle is None:
+            # Variants of a listed rule (e.g. 'frame-title-unique') fall back
+            # to substring matching, in the order the principles are listed
+            principle = next(
+                (principle for rule, principle in _RULE_TO_PRINCIPLE.items() if rule in rule_id),
+                'Unknown'
+            )
+        return principle
 
     def cleanup(self):
         """Close the WebDriver"""
@@ -252,11 +396,84 @@ class AccessibilityChecker:
             self.driver.quit()
 
 
+def check_urls_parallel(urls: List[str], workers: int, **checker_options) -> List[Dict[str, Any]]:
+    """
+    Check URLs concurrently, one browser per worker thread
+
+    WebDriver sessions are not thread-safe, so each thread lazily creates
+    its own AccessibilityChecker and reuses it for every URL it picks up.
+
+    Args:
+        urls: The URLs to check
+        workers: Number of worker threads (and browsers)
+        **checker_options: Passed to each AccessibilityChecker
+
+    Returns:
+        Enhanced results for each URL, in the order given
+    """
+    local = threading.local()
+    checkers = []
+
+    def check(url: str) -> Dict[str, Any]:
+        checker = getattr(local, 'checker', None)
+        if checker is None:
+            checker = local.checker = AccessibilityChecker(**checker_options)
+            checkers.append(checker)
+        return checker.check_url(url)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(check, urls))
+    finally:
+        for checker in checkers:
+            checker.cleanup()
+
+
+def extract_rules(pages: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Move rule metadata out of each page's results into one table
+
+    Args:
+        pages: Enhanced results for each URL, modified in place
+
+    Returns:
+        Rule ID -> help, description, helpUrl and tags
+    """
+    rules = {}
+    for page in pages:
+        for results in (page['violations']['all'], page.get('passes', ())):
+            for result in results:
+                metadata = {key: result.pop(key) for key in _RULE_METADATA_KEYS if key in result}
+                rules.setdefault(result['id'], metadata)
+    return rules
+
+
+def write_json(data: Dict[str, Any], path: str):
+    """Write data as indented UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def print_summary(results: Dict[str, Any]):
+    """Print a one-page summary of results to stderr"""
+    print(f"\n✓ Accessibility check complete", file=sys.stderr)
+    print(f"  URL: {results['url']}", file=sys.stderr)
+    print(f"  Total violations: {results['summary']['total_violations']}", file=sys.stderr)
+    print(f"    Level A: {results['summary']['level_a_violations']}", file=sys.stderr)
+    print(f"    Level AA: {results['summary']['level_aa_violations']}", file=sys.stderr)
+    print(f"    Level AAA: {results['summary']['level_aaa_violations']}", file=sys.stderr)
+    print(f"  EAA Compliant: {'✓ YES' if results['summary']['eaa_compliant'] else '✗ NO'}", file=sys.stderr)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Run automated accessibility checks on a website using axe-core'
     )
-    parser.add_argument('url', help='URL to check for accessibility issues')
+    parser.add_argument('urls', nargs='+', metavar='url', help='URL(s) to check for accessibility issues')
     parser.add_argument(
         '--output', '-o',
         default='violations.json',
@@ -267,36 +484,76 @@ def main():
         action='store_true',
         help='Run browser in visible mode (for debugging)'
     )
+    parser.add_argument(
+        '--include-passes',
+        action='store_true',
+        help='Collect full details of passing checks in the output (slower)'
+    )
+    parser.add_argument(
+        '--max-nodes',
+        type=int,
+        default=50,
+        help='Affected elements to record per violation, 0 for all (default: 50)'
+    )
+    parser.add_argument(
+        '--block-assets',
+        action='store_true',
+        help='Skip loading images, fonts and media (faster; may miss content drawn by images)'
+    )
+    parser.add_argument(
+        '--full-load',
+        action='store_true',
+        help='Wait for the page load event before checking (default: start once the DOM is ready)'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        help='Browsers to run in parallel for several URLs (default: one per URL, up to 8)'
+    )
 
     args = parser.parse_args()
-
-    checker = AccessibilityChecker(headless=not args.no_headless)
+    if args.max_nodes < 0:
+        parser.error('--max-nodes must be 0 or more')
+    workers = args.workers or min(8, len(args.urls))
+    checker_options = {
+        'headless': not args.no_headless,
+        'include_passes': args.include_passes,
+        'max_nodes': args.max_nodes,
+        'block_assets': args.block_assets,
+        'full_load': args.full_load
+    }
+    checker = None
 
     try:
-        results = checker.check_url(args.url)
+        if workers > 1 and len(args.urls) > 1:
+            pages = check_urls_parallel(args.urls, workers, **checker_options)
+        else:
+            checker = AccessibilityChecker(**checker_options)
+            pages = list(checker.check_urls(args.urls))
+
+        for results in pages:
+            print_summary(results)
+
+        # A single URL keeps the original one-page format
+        if len(pages) == 1:
+            output = pages[0]
+        else:
+            output = {'rules': extract_rules(pages), 'pages': pages}
 
         # Write results to file
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-
-        # Print summary to stderr
-        print(f"\n✓ Accessibility check complete", file=sys.stderr)
-        print(f"  URL: {results['url']}", file=sys.stderr)
-        print(f"  Total violations: {results['summary']['total_violations']}", file=sys.stderr)
-        print(f"    Level A: {results['summary']['level_a_violations']}", file=sys.stderr)
-        print(f"    Level AA: {results['summary']['level_aa_violations']}", file=sys.stderr)
-        print(f"    Level AAA: {results['summary']['level_aaa_violations']}", file=sys.stderr)
-        print(f"  EAA Compliant: {'✓ YES' if results['summary']['eaa_compliant'] else '✗ NO'}", file=sys.stderr)
+        write_json(output, args.output)
+
         print(f"\nResults written to: {args.output}", file=sys.stderr)
 
         # Exit with error code if violations found
-        sys.exit(0 if results['summary']['eaa_compliant'] else 1)
+        sys.exit(0 if all(page['summary']['eaa_compliant'] for page in pages) else 1)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
     finally:
-        checker.cleanup()
+        if checker:
+            checker.cleanup()
 
 
 if __name__ == '__main__':
@@ -8,50 +8,135 @@ Usage:
 """
 
 import argparse
+import heapq
+import io
 import json
 import sys
 from datetime import datetime
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, TextIO
+
+# Optional: several times faster parsing of large violations files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared read-only default for missing sections of the results
+_EMPTY = MappingProxyType({})
+
+# Severity buckets of a page without violations
+_NO_VIOLATIONS = MappingProxyType({'CRITICAL': [], 'HIGH': [], 'MEDIUM': [], 'LOW': []})
+
+# Next-steps phases: (severity, heading, violations listed)
+_NEXT_STEP_PHASES = [
+    ('CRITICAL', "### Phase 1: Critical Issues (Immediate - 1-2 weeks)\n", 5),
+    ('HIGH', "### Phase 2: High Priority (2-4 weeks)\n", 5),
+    ('MEDIUM', "### Phase 3: Medium Priority (1-2 months)\n", 5),
+    ('LOW', "### Phase 4: Low Priority (Ongoing)\n", 3),
+]
+
+
+class LineWriter:
+    """Write report lines straight to a file, newline-separated"""
+
+    def __init__(self, fp: TextIO):
+        self.fp = fp
+        self.separator = ''
+
+    def append(self, line: str):
+        self.fp.write(self.separator)
+        self.fp.write(line)
+        self.separator = '\n'
+
+    def extend(self, lines: List[str]):
+        for line in lines:
+            self.append(line)
 
 
 class ReportGenerator:
     """Generate formatted accessibility compliance reports"""
 
     def __init__(self, violations_file: str):
-        with open(violations_file, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        if orjson is not None:
+            with open(violations_file, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(violations_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        # automated_checks.py writes {"rules": {...}, "pages": [...]} when given
+        # several URLs, with each rule's help text stored once under "rules"
+        self.pages = data['pages'] if 'pages' in data else [data]
+        self.rules = data.get('rules', _EMPTY)
+        self.data = self.pages[0]
 
     def generate_markdown(self) -> str:
-        """Generate a markdown-formatted accessibility report"""
-        report = []
+        """Generate a markdown-formatted accessibility report, one section per page"""
+        buffer = io.StringIO()
+        self.write_markdown(buffer)
+        return buffer.getvalue()
+
+    def write_markdown(self, fp: TextIO):
+        """Write the markdown report to fp as it is generated"""
+        # Sections write their lines as they go; the full report is never held in memory
+        report = LineWriter(fp)
+        for page in self.pages:
+            self._generate_page_markdown(page, report)
+
+    def _generate_page_markdown(self, page: Dict[str, Any], report: LineWriter):
+        """Append the report for a single checked URL"""
+        # The section helpers read the current page from these attributes,
+        # looked up once per page
+        self.data = page
+        self._summary = page.get('summary', _EMPTY)
+        self._violations = page.get('violations', _EMPTY)
+
+        if self._summary.get('total_violations', 0) == 0:
+            self._generate_clean_report(report)
+            return
+
+        self._by_severity = self._violations_by_severity()
 
         # Header
-        report.append("# Accessibility Audit Report\n")
-        report.append(f"**Website:** {self.data.get('url', 'N/A')}\n")
-        report.append(f"**Date:** {self.data.get('timestamp', 'N/A')}\n")
-        report.append(f"**Tool:** {self.data.get('tool', 'axe-core')}\n")
-        report.append("\n---\n")
+        self._generate_header(report)
 
         # Executive Summary
-        report.append(self._generate_executive_summary())
+        self._generate_executive_summary(report)
 
         # Violations by Principle
         report.append("\n## Violations by POUR Principle\n")
-        report.append(self._generate_violations_by_principle())
+        self._generate_violations_by_principle(report)
 
         # Testing Methodology
         report.append("\n## Testing Methodology\n")
-        report.append(self._generate_methodology())
+        self._generate_methodology(report)
 
         # Next Steps
         report.append("\n## Next Steps (Prioritized)\n")
-        report.append(self._generate_next_steps())
+        self._generate_next_steps(report)
+
+    def _generate_clean_report(self, report: LineWriter):
+        """Append the short report for a page without violations"""
+        self._by_severity = _NO_VIOLATIONS
+
+        self._generate_header(report)
+        self._generate_executive_summary(report)
 
-        return '\n'.join(report)
+        report.append("\n## Testing Methodology\n")
+        self._generate_methodology(report)
+
+    def _generate_header(self, report: LineWriter):
+        """Append the report title and page details"""
+        report.append("# Accessibility Audit Report\n")
+        report.append(f"**Website:** {self.data.get('url', 'N/A')}\n")
+        report.append(f"**Date:** {self.data.get('timestamp', 'N/A')}\n")
+        report.append(f"**Tool:** {self.data.get('tool', 'axe-core')}\n")
+        report.append("\n---\n")
 
-    def _generate_executive_summary(self) -> str:
-        """Generate executive summary section"""
-        summary = self.data.get('summary', {})
+    def _generate_executive_summary(self, lines: LineWriter):
+        """Append the executive summary section"""
+        summary = self._summary
         total = summary.get('total_violations', 0)
         level_a = summary.get('level_a_violations', 0)
         level_aa = summary.get('level_aa_violations', 0)
@@ -59,19 +144,19 @@ class ReportGenerator:
         eaa_compliant = summary.get('eaa_compliant', False)
 
         # Count severity
-        violations_all = self.data.get('violations', {}).get('all', [])
-        critical = sum(1 for v in violations_all if v.get('severity') == 'CRITICAL')
-        high = sum(1 for v in violations_all if v.get('severity') == 'HIGH')
-        medium = sum(1 for v in violations_all if v.get('severity') == 'MEDIUM')
-        low = sum(1 for v in violations_all if v.get('severity') == 'LOW')
+        by_severity = self._by_severity
+        critical = len(by_severity['CRITICAL'])
+        high = len(by_severity['HIGH'])
+        medium = len(by_severity['MEDIUM'])
+        low = len(by_severity['LOW'])
 
-        lines = [
+        lines.extend([
             "## Executive Summary\n",
             f"- **Total issues:** {total} ({critical} critical, {high} high, {medium} medium, {low} low)",
             f"- **Level A compliance:** {'✓ PASS' if level_a == 0 else f'✗ FAIL ({level_a} issues)'}",
             f"- **Level AA compliance:** {'✓ PASS' if level_aa == 0 else f'✗ FAIL ({level_aa} issues)'}",
             f"- **Overall EAA compliance:** {'✓ PASS' if eaa_compliant else '✗ FAIL'}\n"
-        ]
+        ])
 
         if not eaa_compliant:
             lines.append(
@@ -84,12 +169,40 @@ class ReportGenerator:
                 "based on automated testing. Manual testing is still required for full EAA compliance.\n"
             )
 
-        return '\n'.join(lines)
-
-    def _generate_violations_by_principle(self) -> str:
-        """Generate violations organized by POUR principle"""
-        lines = []
-        violations_by_principle = self.data.get('violations', {}).get('by_principle', {})
+    def _violations_grouped(self, name: str):
+        """
+        Violations grouped by 'level', 'principle' or 'severity'
+
+        automated_checks.py stores each group as indexes into the full list;
+        older versions stored copies of the violations themselves.
+        Returns None if the results have no such grouping.
+        """
+        violations = self._violations
+        index = violations.get(f'index_by_{name}')
+        if index is None:
+            return violations.get(f'by_{name}')
+
+        violations_all = violations.get('all', [])
+        return {
+            group: [violations_all[i] for i in indexes]
+            for group, indexes in index.items()
+        }
+
+    def _violations_by_severity(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Violations grouped by severity, as categorized by automated_checks.py"""
+        by_severity = self._violations_grouped('severity')
+        if by_severity is None:
+            # Results from older versions of automated_checks.py: one pass
+            by_severity = {'CRITICAL': [], 'HIGH': [], 'MEDIUM': [], 'LOW': []}
+            for violation in self._violations.get('all', []):
+                severity = violation.get('severity')
+                if severity in by_severity:
+                    by_severity[severity].append(violation)
+        return by_severity
+
+    def _generate_violations_by_principle(self, lines: LineWriter):
+        """Append violations organized by POUR principle"""
+        violations_by_principle = self._violations_grouped('principle') or {}
 
         principles = [
             ('Perceivable', violations_by_principle.get('Perceivable', [])),
@@ -107,20 +220,18 @@ class ReportGenerator:
             lines.append(f"### {principle_name} ({len(principle_violations)} issues)\n")
 
             for violation in principle_violations:
-                lines.append(self._format_violation(violation))
-
-        return '\n'.join(lines)
+                self._format_violation(violation, lines)
 
-    def _format_violation(self, violation: Dict[str, Any]) -> str:
-        """Format a single violation with all details"""
-        lines = []
+    def _format_violation(self, violation: Dict[str, Any], lines: LineWriter):
+        """Append a single violation with all details"""
 
         # Header with success criterion
         wcag_level = violation.get('wcag_level', 'Unknown')
         severity = violation.get('severity', 'MEDIUM')
-        description = violation.get('description', 'No description')
-        help_text = violation.get('help', 'No help available')
-        help_url = violation.get('helpUrl', '')
+        rule = self._rule(violation)
+        description = rule.get('description', 'No description')
+        help_text = rule.get('help', 'No help available')
+        help_url = rule.get('helpUrl', '')
 
         lines.append(f"#### {help_text} (Level {wcag_level}) - {severity}\n")
 
@@ -133,8 +244,9 @@ class ReportGenerator:
 
         # Affected nodes
         nodes = violation.get('nodes', [])
+        node_count = self._node_count(violation)
         if nodes:
-            lines.append(f"**Affected elements:** {len(nodes)} instance(s)\n")
+            lines.append(f"**Affected elements:** {node_count} instance(s)\n")
             lines.append("**Locations:**")
 
             # Show up to 5 examples
@@ -149,8 +261,9 @@ class ReportGenerator:
                 if failure_summary:
                     lines.append(f"   {failure_summary}")
 
-            if len(nodes) > 5:
-                lines.append(f"\n...and {len(nodes) - 5} more instance(s)")
+            shown = min(len(nodes), 5)
+            if node_count > shown:
+                lines.append(f"\n...and {node_count - shown} more instance(s)")
 
         # Remediation guidance
         lines.append("\n**How to fix:**")
@@ -175,11 +288,20 @@ class ReportGenerator:
 
         lines.append("\n---\n")
 
-        return '\n'.join(lines)
+    def _rule(self, violation: Dict[str, Any]) -> Dict[str, Any]:
+        """Help text and links for a violation, from the shared rules table in batch results"""
+        if 'help' in violation:
+            return violation
+        return self.rules.get(violation.get('id'), _EMPTY)
+
+    @staticmethod
+    def _node_count(violation: Dict[str, Any]) -> int:
+        """Elements affected by a violation, including any not recorded in the results"""
+        return violation.get('node_count_total', len(violation.get('nodes', [])))
 
-    def _generate_methodology(self) -> str:
-        """Generate testing methodology section"""
-        lines = [
+    def _generate_methodology(self, lines: LineWriter):
+        """Append the testing methodology section"""
+        lines.extend([
             "**Automated Testing:**",
             f"- Tool: {self.data.get('tool', 'axe-core')}",
             "- Standard: WCAG 2.2 Level A and AA",
@@ -198,54 +320,22 @@ class ReportGenerator:
             "- EN 301 549 (European standard)",
             "- European Accessibility Act (EAA) compliance deadline: June 28, 2025",
             ""
-        ]
-        return '\n'.join(lines)
-
-    def _generate_next_steps(self) -> str:
-        """Generate prioritized next steps"""
-        violations_all = self.data.get('violations', {}).get('all', [])
-
-        # Categorize by severity
-        critical = [v for v in violations_all if v.get('severity') == 'CRITICAL']
-        high = [v for v in violations_all if v.get('severity') == 'HIGH']
-        medium = [v for v in violations_all if v.get('severity') == 'MEDIUM']
-        low = [v for v in violations_all if v.get('severity') == 'LOW']
+        ])
 
-        lines = []
-
-        if critical:
-            lines.append("### Phase 1: Critical Issues (Immediate - 1-2 weeks)\n")
-            for i, violation in enumerate(critical[:5], 1):
-                node_count = len(violation.get('nodes', []))
-                lines.append(
-                    f"{i}. {violation.get('help', 'Fix issue')} - {node_count} instance(s)"
-                )
-            lines.append("")
-
-        if high:
-            lines.append("### Phase 2: High Priority (2-4 weeks)\n")
-            for i, violation in enumerate(high[:5], 1):
-                node_count = len(violation.get('nodes', []))
-                lines.append(
-                    f"{i}. {violation.get('help', 'Fix issue')} - {node_count} instance(s)"
-                )
-            lines.append("")
-
-        if medium:
-            lines.append("### Phase 3: Medium Priority (1-2 months)\n")
-            for i, violation in enumerate(medium[:5], 1):
-                node_count = len(violation.get('nodes', []))
-                lines.append(
-                    f"{i}. {violation.get('help', 'Fix issue')} - {node_count} instance(s)"
-                )
-            lines.append("")
+    def _generate_next_steps(self, lines: LineWriter):
+        """Append prioritized next steps"""
+        for severity, heading, limit in _NEXT_STEP_PHASES:
+            violations = self._by_severity[severity]
+            if not violations:
+                continue
 
-        if low:
-            lines.append("### Phase 4: Low Priority (Ongoing)\n")
-            for i, violation in enumerate(low[:3], 1):
-                node_count = len(violation.get('nodes', []))
+            # The most widespread issues of each severity first
+            lines.append(heading)
+            top = heapq.nsmallest(limit, violations, key=lambda v: -self._node_count(v))
+            for i, violation in enumerate(top, 1):
+                node_count = self._node_count(violation)
                 lines.append(
-                    f"{i}. {violation.get('help', 'Fix issue')} - {node_count} instance(s)"
+                    f"{i}. {self._rule(violation).get('help', 'Fix issue')} - {node_count} instance(s)"
                 )
             lines.append("")
 
@@ -263,8 +353,6 @@ class ReportGenerator:
             "(approximately 6-8 weeks)\n"
         )
 
-        return '\n'.join(lines)
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -290,11 +378,10 @@ def main():
 
     try:
         generator = ReportGenerator(args.violations_file)
-        report = generator.generate_markdown()
 
         # Write report
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(report)
+        with open(args.output, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            generator.write_markdown(f)
 
         print(f"✓ Report generated: {args.output}", file=sys.stderr)
 